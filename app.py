@@ -1,432 +1,574 @@
-import streamlit as st
-import pandas as pd
-import plotly.express as px
-import plotly.graph_objects as go
-from datetime import datetime
-import numpy as np
-
-# Page configuration
-st.set_page_config(
-    page_title="Dashboard Analisis Kesehatan Rumah Sakit",
-    page_icon="🏥",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
-
-# Load and clean data
-@st.cache_data
-def load_data():
-    df = pd.read_csv('healthcare_dataset_no_duplicates.csv')
-    
-    # Clean column names
-    df.columns = df.columns.str.strip().str.lower().str.replace(' ', '_')
-    
-    # Convert dates
-    df['date_of_admission'] = pd.to_datetime(df['date_of_admission'], errors='coerce')
-    df['discharge_date'] = pd.to_datetime(df['discharge_date'], errors='coerce')
-    
-    # Calculate length of stay
-    df['length_of_stay'] = (df['discharge_date'] - df['date_of_admission']).dt.days
-    
-    # Clean billing amount
-    df['billing_amount'] = df['billing_amount'].clip(lower=0)
-    
-    return df
-
-df = load_data()
-
-# Professional styling
-st.markdown("""
-<style>
-    .main-title {
-        font-size: 2.5rem;
-        color: #2C3E50;
-        text-align: center;
-        margin-bottom: 1rem;
-        font-weight: 700;
-        letter-spacing: -0.5px;
-    }
-    .section-title {
-        font-size: 1.5rem;
-        color: #2C3E50;
-        margin: 2rem 0 1rem 0;
-        border-bottom: 2px solid #3498DB;
-        padding-bottom: 0.5rem;
-        font-weight: 600;
-    }
-    .metric-card {
-        background-color: #f8f9fa;
-        padding: 1rem;
-        border-radius: 8px;
-        border-left: 4px solid #3498DB;
-    }
-</style>
-""", unsafe_allow_html=True)
-
-# Header
-st.markdown('<div class="main-title">Dashboard Analisis Kesehatan Rumah Sakit</div>', unsafe_allow_html=True)
-st.markdown("### Fokus: Tren Penyakit, Biaya Pengobatan, Demografi Pasien")
-
-# Sidebar navigation
-st.sidebar.header("Navigasi")
-analysis_focus = st.sidebar.radio(
-    "Pilih Fokus Analisis:",
-    ["Tren Penyakit", "Biaya Pengobatan", "Demografi Pasien"]
-)
-
-# Global filters
-st.sidebar.header("Filter Data")
-year_filter = st.sidebar.selectbox(
-    "Periode Waktu",
-    options=["Semua Tahun"] + sorted(df['date_of_admission'].dt.year.dropna().unique().tolist())
-)
-
-condition_filter = st.sidebar.selectbox(
-    "Kondisi Medis",
-    options=["Semua Kondisi"] + sorted(df['medical_condition'].unique().tolist())
-)
-
-age_range = st.sidebar.slider(
-    "Rentang Usia",
-    min_value=int(df['age'].min()),
-    max_value=int(df['age'].max()),
-    value=(13, 89)
-)
-
-# Apply filters
-filtered_df = df.copy()
-if year_filter != "Semua Tahun":
-    filtered_df = filtered_df[filtered_df['date_of_admission'].dt.year == year_filter]
-if condition_filter != "Semua Kondisi":
-    filtered_df = filtered_df[filtered_df['medical_condition'] == condition_filter]
-filtered_df = filtered_df[(filtered_df['age'] >= age_range[0]) & (filtered_df['age'] <= age_range[1])]
-
-# Quick Stats
-st.markdown("## Summary")
-col1, col2, col3, col4 = st.columns(4)
-
-with col1:
-    st.metric("Total Pasien", f"{len(filtered_df):,}")
-
-with col2:
-    avg_stay = filtered_df['length_of_stay'].mean()
-    st.metric("Rata-rata Masa Rawat", f"{avg_stay:.1f} hari")
-
-with col3:
-    avg_bill = filtered_df['billing_amount'].mean()
-    st.metric("Rata-rata Biaya", f"${avg_bill:,.0f}")
-
-with col4:
-    recovery_rate = (filtered_df['test_results'] == 'Normal').mean() * 100
-    st.metric("Tingkat Pemulihan", f"{recovery_rate:.1f}%")
-
-# ============================================================
-# 1️⃣ TREN PENYAKIT
-# ============================================================
-if analysis_focus == "Tren Penyakit":
-    st.markdown('<div class="section-title">Analisis Tren Penyakit</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns([2, 1])
-    
-    with col1:
-        # Line Chart: Disease trends over time
-        st.subheader("Tren Penyakit Berdasarkan Waktu")
-        
-        # Prepare data for monthly trends
-        monthly_trend = filtered_df.groupby([
-            pd.Grouper(key='date_of_admission', freq='M'),
-            'medical_condition'
-        ]).size().reset_index(name='jumlah_pasien')
-        
-        if not monthly_trend.empty:
-            fig_trend = px.line(
-                monthly_trend,
-                x='date_of_admission',
-                y='jumlah_pasien',
-                color='medical_condition',
-                title="Tren Jumlah Pasien per Kondisi Medis",
-                markers=True
-            )
-            fig_trend.update_layout(
-                xaxis_title="Bulan",
-                yaxis_title="Jumlah Pasien",
-                showlegend=True
-            )
-            st.plotly_chart(fig_trend, use_container_width=True)
-    
-    with col2:
-        # Top conditions - simple version
-        st.subheader("Kondisi Medis Paling Umum")
-        top_conditions = filtered_df['medical_condition'].value_counts().head(10)
-        
-        fig_top_conditions = px.bar(
-            x=top_conditions.values,
-            y=top_conditions.index,
-            orientation='h',
-            title="Distribusi Kondisi Medis",
-            labels={'x': 'Jumlah Pasien', 'y': ''},
-            color=top_conditions.values,
-            color_continuous_scale='Blues'
-        )
-        
-        fig_top_conditions.update_layout(
-            showlegend=False,
-            yaxis={'categoryorder': 'total ascending'},
-            margin=dict(l=20, r=20, t=50, b=20)
-        )
-        
-        st.plotly_chart(fig_top_conditions, use_container_width=True)
-        
-        # Optional: Show summary statistics
-        st.caption(f"Total {len(filtered_df)} pasien • {top_conditions.index[0]} paling umum ({top_conditions.iloc[0]} pasien)")
-    
-    # Seasonal patterns
-    st.subheader("Pola Kunjungan Rumah Sakit Musiman")
-    monthly_visits = filtered_df['date_of_admission'].dt.month.value_counts().sort_index()
-    
-    # Ensure all months are represented
-    all_months = pd.Series(range(1, 13), index=range(1, 13))
-    monthly_visits_complete = all_months.map(monthly_visits).fillna(0)
-    
-    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 
-                   'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
-    
-    fig_seasonal = px.bar(
-        x=month_names,
-        y=monthly_visits_complete.values,
-        title="Kunjungan Rumah Sakit per Bulan",
-        labels={'x': 'Bulan', 'y': 'Jumlah Pasien'},
-        color=monthly_visits_complete.values,
-        color_continuous_scale='Blues'
-    )
-    st.plotly_chart(fig_seasonal, use_container_width=True)
-    
-    # Admission types by condition
-    st.subheader("Tipe Penerimaan per Kondisi Medis")
-    admission_condition = filtered_df.groupby(['medical_condition', 'admission_type']).size().reset_index(name='jumlah')
-
-    fig_admission = px.bar(
-        admission_condition,
-        x='medical_condition',
-        y='jumlah',
-        color='admission_type',
-        title="Distribusi Tipe Penerimaan per Kondisi Medis",
-        barmode='group',
-        color_discrete_map={
-            'Emergency': '#DC2626',
-            'Urgent': '#EA580C', 
-            'Elective': '#16A34A'
-        }
-    )
-    
-    fig_admission.update_layout(xaxis_title="Kondisi Medis", yaxis_title="Jumlah Pasien")
-    st.plotly_chart(fig_admission, use_container_width=True)
-
-# ============================================================
-# 2️⃣ BIAYA PENGOBATAN
-# ============================================================
-elif analysis_focus == "Biaya Pengobatan":
-    st.markdown('<div class="section-title">Analisis Biaya Pengobatan</div>', unsafe_allow_html=True)
-    
-    # Average cost by hospital
-    st.subheader("Rata-rata Biaya per Rumah Sakit")
-    hospital_costs = filtered_df.groupby('hospital')['billing_amount'].mean().sort_values(ascending=False).head(10)
-    
-    fig_hospital_cost = px.bar(
-        x=hospital_costs.values,
-        y=hospital_costs.index,
-        orientation='h',
-        title="10 Rumah Sakit dengan Biaya Tertinggi",
-        labels={'x': 'Rata-rata Biaya ($)', 'y': 'Rumah Sakit'},
-        color=hospital_costs.values,
-        color_continuous_scale='Reds'
-    )
-    
-    fig_hospital_cost.update_layout(
-        autosize=True,
-        margin=dict(l=20, r=20, t=50, b=20),
-    )
-    fig_hospital_cost.update_yaxes(autorange="reversed")
-    
-    st.plotly_chart(fig_hospital_cost, use_container_width=True)
-    
-    # Insurance and costs
-    st.subheader("Analisis Biaya Berdasarkan Asuransi")
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Insurance distribution
-        insurance_counts = filtered_df['insurance_provider'].value_counts().head(8)
-        fig_insurance = px.pie(
-            values=insurance_counts.values,
-            names=insurance_counts.index,
-            title="Distribusi Provider Asuransi"
-        )
-        st.plotly_chart(fig_insurance, use_container_width=True)
-    
-    with col2:
-        # Cost by insurance
-        insurance_costs = filtered_df.groupby('insurance_provider')['billing_amount'].mean().sort_values(ascending=False).head(8)
-        fig_insurance_cost = px.bar(
-            x=insurance_costs.index,
-            y=insurance_costs.values,
-            title="Rata-rata Biaya per Provider Asuransi",
-            labels={'x': 'Provider Asuransi', 'y': 'Rata-rata Biaya ($)'},
-            color=insurance_costs.index,  # Add this line to enable color mapping
-            color_discrete_map={
-                'Cigna': "#75B0EB",
-                'Medicare': "#2F5FE3", 
-                'UnitedHealthCare': "#EDC0D0",
-                'Blue Cross': "#E20B0B",
-                'Aetna': "#7BD894",
-            }
-        )
-        fig_insurance_cost.update_layout(showlegend=False)  # Hide legend since colors are self-explanatory
-        st.plotly_chart(fig_insurance_cost, use_container_width=True)
-    
-    # Cost vs Recovery analysis
-    st.subheader("Analisis Hubungan Biaya dengan Tingkat Pemulihan")
-    condition_analysis = filtered_df.groupby('medical_condition').agg({
-        'billing_amount': 'mean',
-        'test_results': lambda x: (x == 'Normal').mean() * 100,
-        'length_of_stay': 'mean'
-    }).round(2).reset_index()
-    
-    condition_analysis.columns = ['Kondisi_Medis', 'Biaya_Rata', 'Tingkat_Pemulihan', 'Masa_Rawat_Rata']
-    
-    fig_cost_recovery = px.scatter(
-        condition_analysis,
-        x='Biaya_Rata',
-        y='Tingkat_Pemulihan',
-        size='Masa_Rawat_Rata',
-        color='Kondisi_Medis',
-        title="Hubungan Biaya Pengobatan dengan Tingkat Pemulihan",
-        labels={
-            'Biaya_Rata': 'Rata-rata Biaya ($)',
-            'Tingkat_Pemulihan': 'Tingkat Pemulihan (%)',
-            'Masa_Rawat_Rata': 'Rata-rata Masa Rawat (hari)'
-        },
-        hover_data=['Kondisi_Medis', 'Biaya_Rata', 'Tingkat_Pemulihan', 'Masa_Rawat_Rata']
-    )
-    st.plotly_chart(fig_cost_recovery, use_container_width=True)
-
-# ============================================================
-# 3️⃣ DEMOGRAFI PASIEN
-# ============================================================
-elif analysis_focus == "Demografi Pasien":
-    st.markdown('<div class="section-title">Analisis Demografi Pasien</div>', unsafe_allow_html=True)
-    
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        # Age distribution
-        st.subheader("Distribusi Usia Pasien")
-        
-        # Create age groups
-        age_bins = [0, 18, 35, 50, 65, 100]
-        age_labels = ['Anak (0-18)', 'Dewasa Muda (19-35)', 'Dewasa (36-50)', 'Lansia (51-65)', 'Manula (65+)']
-        filtered_df['kelompok_usia'] = pd.cut(filtered_df['age'], bins=age_bins, labels=age_labels)
-        
-        age_counts = filtered_df['kelompok_usia'].value_counts()
-        
-        fig_age = px.bar(
-            x=age_counts.index,
-            y=age_counts.values,
-            title="Distribusi Pasien berdasarkan Kelompok Usia",
-            labels={'x': 'Kelompok Usia', 'y': 'Jumlah Pasien'},
-            color=age_counts.index,
-            color_discrete_sequence=['#3498DB', '#9B59B6', '#2ECC71', '#F39C12', '#E74C3C']
-        )
-        fig_age.update_layout(showlegend=False)
-        st.plotly_chart(fig_age, use_container_width=True)
-    
-    with col2:
-        # Gender distribution
-        st.subheader("Distribusi Jenis Kelamin")
-        gender_counts = filtered_df['gender'].value_counts()
-        
-        fig_gender = px.pie(
-            values=gender_counts.values,
-            names=gender_counts.index,
-            title="Proporsi Jenis Kelamin Pasien",
-            color_discrete_sequence=['#4A90E2', '#FF6B9D']
-        )
-        fig_gender.update_traces(textinfo='percent+label')
-        st.plotly_chart(fig_gender, use_container_width=True)
-    
-    # Gender by condition
-    st.subheader("Kondisi Medis berdasarkan Jenis Kelamin")
-    gender_condition = filtered_df.groupby(['medical_condition', 'gender']).size().reset_index(name='jumlah')
-    top_conditions = gender_condition.groupby('medical_condition')['jumlah'].sum().nlargest(6).index
-    gender_condition_top = gender_condition[gender_condition['medical_condition'].isin(top_conditions)]
-    
-    fig_gender_condition = px.bar(
-        gender_condition_top,
-        x='medical_condition',
-        y='jumlah',
-        color='gender',
-        title="6 Kondisi Medis Terbanyak berdasarkan Jenis Kelamin",
-        labels={'jumlah': 'Jumlah Pasien', 'medical_condition': 'Kondisi Medis'},
-        color_discrete_sequence=['#FF6B9D', '#4A90E2'],
-        barmode='group'
-    )
-    st.plotly_chart(fig_gender_condition, use_container_width=True)
-    
-    # Blood type distribution
-    st.subheader("Distribusi Golongan Darah")
-    blood_counts = filtered_df['blood_type'].value_counts()
-    
-    fig_blood = px.bar(
-        x=blood_counts.index,
-        y=blood_counts.values,
-        title="Distribusi Golongan Darah Pasien",
-        labels={'x': 'Golongan Darah', 'y': 'Jumlah Pasien'},
-        color=blood_counts.index,
-        color_discrete_sequence=px.colors.qualitative.Bold
-    )
-    fig_blood.update_layout(showlegend=False)
-    st.plotly_chart(fig_blood, use_container_width=True)
-    
-    # Hospital demographics
-    st.subheader("Distribusi Pasien per Rumah Sakit")
-    
-    total_hospitals = filtered_df['hospital'].nunique()
-    total_patients = len(filtered_df)
-    
-    hospital_demo = filtered_df.groupby(['hospital', 'gender']).size().reset_index(name='jumlah')
-    top_hospitals = hospital_demo.groupby('hospital')['jumlah'].sum().nlargest(8).index
-    hospital_demo_top = hospital_demo[hospital_demo['hospital'].isin(top_hospitals)]
-    
-    top_hospitals_total_patients = hospital_demo_top['jumlah'].sum()
-    percentage_of_total = (top_hospitals_total_patients / total_patients) * 100
-    
-    fig_hospital_demo = px.bar(
-        hospital_demo_top,
-        x='hospital',
-        y='jumlah',
-        color='gender',
-        title=f"8 Rumah Sakit dengan Volume Pasien Tertinggi ({percentage_of_total:.1f}% dari {total_patients:,} total pasien)",
-        labels={'jumlah': 'Jumlah Pasien', 'hospital': 'Rumah Sakit'},
-        color_discrete_sequence=['#FF6B9D', '#4A90E2'],
-        barmode='group'
-    )
-    
-    # Add subtitle with context
-    st.caption(f"Menampilkan 8 rumah sakit teratas dari total {total_hospitals} rumah sakit")
-    st.plotly_chart(fig_hospital_demo, use_container_width=True)
-
-# Footer
-st.markdown("---")
-st.markdown("""
-<div style="text-align: center; color: #7F8C8D;">
-    <p><strong>Dashboard Analisis Kesehatan</strong> - Fokus: Tren Penyakit, Biaya Pengobatan, Demografi Pasien</p>
-</div>
-""", unsafe_allow_html=True)
-
-st.sidebar.markdown("---")
-st.sidebar.markdown("""
-### Panduan Dashboard
-- **Tren Penyakit**: Pola temporal dan musiman
-- **Biaya Pengobatan**: Analisis biaya dan asuransi  
-- **Demografi Pasien**: Distribusi usia, jenis kelamin, golongan darah
-""")
+import streamlit as st
+import pandas as pd
+import plotly.express as px
+import plotly.graph_objects as go
+import plotly.io as pio
+from plotly.subplots import make_subplots
+from datetime import datetime
+import numpy as np
+
+# Page configuration
+st.set_page_config(
+    page_title="Dashboard Analisis Kesehatan Rumah Sakit",
+    page_icon="🏥",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+# Static page chrome, built once at import time. The CSS and the header
+# live in one string so the whole block is a single st.markdown element
+# instead of several. (It still has to be emitted on every rerun: Streamlit
+# drops any element a rerun doesn't re-produce, so gating it behind
+# session_state would blank the styling after the first interaction.)
+HEADER_HTML = """
+<style>
+    .main-title {
+        font-size: 2.5rem;
+        color: #2C3E50;
+        text-align: center;
+        margin-bottom: 1rem;
+        font-weight: 700;
+        letter-spacing: -0.5px;
+    }
+    .section-title {
+        font-size: 1.5rem;
+        color: #2C3E50;
+        margin: 2rem 0 1rem 0;
+        border-bottom: 2px solid #3498DB;
+        padding-bottom: 0.5rem;
+        font-weight: 600;
+    }
+    .metric-card {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 8px;
+        border-left: 4px solid #3498DB;
+    }
+</style>
+<div class="main-title">Dashboard Analisis Kesehatan Rumah Sakit</div>
+"""
+
+FOOTER_HTML = """
+<div style="text-align: center; color: #7F8C8D;">
+    <p><strong>Dashboard Analisis Kesehatan</strong> - Fokus: Tren Penyakit, Biaya Pengobatan, Demografi Pasien</p>
+</div>
+"""
+
+SIDEBAR_GUIDE = """
+### Panduan Dashboard
+- **Tren Penyakit**: Pola temporal dan musiman
+- **Biaya Pengobatan**: Analisis biaya dan asuransi
+- **Demografi Pasien**: Distribusi usia, jenis kelamin, golongan darah
+"""
+
+# Columns the dashboard actually reads; the rest stay on disk
+USED_COLUMNS = [
+    'date_of_admission', 'admit_year', 'admit_month', 'medical_condition',
+    'admission_type', 'hospital', 'insurance_provider', 'billing_amount',
+    'length_of_stay', 'age', 'kelompok_usia', 'gender', 'blood_type',
+    'test_results', 'is_normal'
+]
+
+
+# Load data
+@st.cache_resource
+def load_data():
+    # Cleaning, date parsing, and dtype setup happen once in prepare_data.py;
+    # the Parquet file already stores datetime64 dates and categorical strings.
+    # cache_resource shares one read-only frame across sessions without the
+    # per-rerun pickling/hashing that cache_data does on DataFrames.
+    return pd.read_parquet('healthcare.parquet', columns=USED_COLUMNS, memory_map=True)
+
+# Keep the frame in session_state as well: after the first run of a session,
+# accessing it is a plain dict lookup with no cache machinery involved
+if 'df' not in st.session_state:
+    st.session_state['df'] = load_data()
+df = st.session_state['df']
+
+
+def cat_counts(series, n=None):
+    """value_counts for a categorical column, as one bincount over its codes.
+
+    Skips the hash-table path entirely: category codes are small ints, so a
+    single C-level bincount produces the full count vector.
+    """
+    counts = np.bincount(series.cat.codes, minlength=len(series.cat.categories))
+    out = pd.Series(counts, index=series.cat.categories).sort_values(ascending=False)
+    return out.head(n) if n is not None else out
+
+
+def filter_data(year_filter, condition_filter, age_range):
+    """Apply the sidebar filters to the full dataset.
+
+    The default view (no year, no condition, full age range) is by far the
+    most common path and is identical to the full frame, so it returns the
+    shared frame directly — no mask, no slice, no cache entry.
+    """
+    opts = sidebar_options()
+    if (year_filter == "Semua Tahun" and condition_filter == "Semua Kondisi"
+            and age_range == (opts['age_min'], opts['age_max'])):
+        return df
+    return _filter_slice(year_filter, condition_filter, age_range)
+
+
+@st.cache_data(max_entries=64, show_spinner=False)
+def _filter_slice(year_filter, condition_filter, age_range):
+    """Materialize one filtered slice, cached on the filter values.
+
+    Builds one combined boolean mask and slices once, instead of allocating
+    an intermediate copy of every column per filter step. Users flip between
+    the same few filter combinations constantly, so the resulting slice is
+    itself cached.
+    """
+    ages = df['age'].values
+    mask = (ages >= age_range[0]) & (ages <= age_range[1])
+    if year_filter != "Semua Tahun":
+        mask &= df['admit_year'].values == year_filter
+    if condition_filter != "Semua Kondisi":
+        mask &= df['medical_condition'].values == condition_filter
+    return df.loc[mask]
+
+
+@st.cache_data(max_entries=256)
+def compute_aggregates(year_filter, condition_filter, age_range):
+    """Precompute every per-chart aggregate table for one filter combination.
+
+    The heavy groupby/value_counts scans shrink the full frame down to a few
+    dozen rows each. Caching on the (small, hashable) filter values means a
+    rerun with unchanged filters — or a revisited combination — reuses the
+    tables instead of re-scanning the frame for every chart.
+    """
+    fdf = filter_data(year_filter, condition_filter, age_range)
+    agg = {}
+
+    # Tren Penyakit
+    # Truncating to datetime64[M] and crosstab-counting on category codes is
+    # much lighter than the pd.Grouper resampling machinery
+    month = fdf['date_of_admission'].values.astype('datetime64[M]')
+    conditions = fdf['medical_condition'].cat.remove_unused_categories()
+    agg['monthly_trend'] = (
+        pd.crosstab(month, conditions, rownames=['date_of_admission'])
+        .stack()
+        .rename('jumlah_pasien')
+        .reset_index()
+    )
+    agg['top_conditions'] = cat_counts(fdf['medical_condition'], 10)
+
+    # One C pass over the int8 month column; minlength guarantees all twelve
+    # months are present, so no reindex/fillna dance is needed
+    agg['monthly_visits'] = np.bincount(fdf['admit_month'].to_numpy(), minlength=13)[1:]
+
+    # Wide count tables: one crosstab pass instead of a long-form groupby
+    # that the grouped-bar charts would pivot back anyway
+    agg['admission_condition'] = pd.crosstab(fdf['medical_condition'], fdf['admission_type'])
+
+    # Biaya Pengobatan
+    agg['hospital_costs'] = fdf.groupby('hospital', observed=True)['billing_amount'].mean().nlargest(10)
+    agg['insurance_counts'] = cat_counts(fdf['insurance_provider'], 8)
+    agg['insurance_costs'] = fdf.groupby('insurance_provider', observed=True)['billing_amount'].mean().nlargest(8)
+
+    # Named aggregations all hit cython kernels; the old per-group lambda on
+    # test_results forced a Python call per group
+    condition_analysis = fdf.groupby('medical_condition', observed=True).agg(
+        Biaya_Rata=('billing_amount', 'mean'),
+        Tingkat_Pemulihan=('is_normal', 'mean'),
+        Masa_Rawat_Rata=('length_of_stay', 'mean')
+    )
+    condition_analysis['Tingkat_Pemulihan'] *= 100
+    condition_analysis = condition_analysis.round(2).reset_index()
+    condition_analysis = condition_analysis.rename(columns={'medical_condition': 'Kondisi_Medis'})
+    agg['condition_analysis'] = condition_analysis
+
+    # Demografi Pasien
+    agg['age_counts'] = cat_counts(fdf['kelompok_usia'])
+    agg['gender_counts'] = cat_counts(fdf['gender'])
+
+    gender_condition = pd.crosstab(
+        fdf['medical_condition'].cat.remove_unused_categories(), fdf['gender']
+    )
+    agg['gender_condition_top'] = gender_condition.loc[gender_condition.sum(axis=1).nlargest(6).index]
+
+    agg['blood_counts'] = cat_counts(fdf['blood_type'])
+
+    hospital_demo = pd.crosstab(fdf['hospital'], fdf['gender']).astype('uint16')
+    agg['hospital_demo_top'] = hospital_demo.loc[hospital_demo.sum(axis=1).nlargest(8).index]
+
+    return agg
+
+
+@st.cache_data(max_entries=256)
+def trend_figure_json(year_filter, condition_filter, age_range):
+    """Pre-serialized monthly-trend figure for one filter combination.
+
+    Building the figure and serializing it dominate this chart's per-rerun
+    cost, so both happen inside the cache; the page body only deserializes
+    the stored JSON on a hit. Returns None when the filters leave no rows.
+    """
+    monthly_trend = compute_aggregates(year_filter, condition_filter, age_range)['monthly_trend']
+    if monthly_trend.empty:
+        return None
+
+    # Build traces directly from the pre-aggregated frame; skips plotly
+    # express' column inference and long-form pivot. Scattergl renders in
+    # WebGL instead of growing the SVG DOM per point.
+    fig = go.Figure()
+    for cond, g in monthly_trend.groupby('medical_condition', observed=True):
+        fig.add_trace(go.Scattergl(
+            x=g['date_of_admission'],
+            y=g['jumlah_pasien'],
+            mode='lines+markers',
+            name=str(cond)
+        ))
+    fig.update_layout(
+        title="Tren Jumlah Pasien per Kondisi Medis",
+        xaxis_title="Bulan",
+        yaxis_title="Jumlah Pasien",
+        showlegend=True
+    )
+    return pio.to_json(fig)
+
+
+@st.cache_data
+def sidebar_options():
+    """Option lists and bounds for the sidebar widgets.
+
+    These never change for a given dataset, so compute them once instead of
+    sorting unique values on every rerun. cat.categories is already sorted.
+    """
+    return {
+        'years': sorted(df['admit_year'].unique().tolist()),
+        'conditions': df['medical_condition'].cat.categories.tolist(),
+        'age_min': int(df['age'].min()),
+        'age_max': int(df['age'].max()),
+    }
+
+# Styling and header: one precomputed block, one markdown element
+st.markdown(HEADER_HTML, unsafe_allow_html=True)
+st.markdown("### Fokus: Tren Penyakit, Biaya Pengobatan, Demografi Pasien")
+
+# Sidebar navigation
+st.sidebar.header("Navigasi")
+analysis_focus = st.sidebar.radio(
+    "Pilih Fokus Analisis:",
+    ["Tren Penyakit", "Biaya Pengobatan", "Demografi Pasien"]
+)
+
+# Global filters
+options = sidebar_options()
+st.sidebar.header("Filter Data")
+year_filter = st.sidebar.selectbox(
+    "Periode Waktu",
+    options=["Semua Tahun"] + options['years']
+)
+
+condition_filter = st.sidebar.selectbox(
+    "Kondisi Medis",
+    options=["Semua Kondisi"] + options['conditions']
+)
+
+age_range = st.sidebar.slider(
+    "Rentang Usia",
+    min_value=options['age_min'],
+    max_value=options['age_max'],
+    value=(13, 89)
+)
+
+# Apply filters and precompute the per-chart aggregate tables
+filtered_df = filter_data(year_filter, condition_filter, age_range)
+agg = compute_aggregates(year_filter, condition_filter, age_range)
+
+# Quick Stats
+st.markdown("## Summary")
+col1, col2, col3, col4 = st.columns(4)
+
+# One fused reduction over the three metric columns instead of three scans
+stats = filtered_df[['length_of_stay', 'billing_amount', 'is_normal']].mean()
+
+with col1:
+    st.metric("Total Pasien", f"{len(filtered_df):,}")
+
+with col2:
+    st.metric("Rata-rata Masa Rawat", f"{stats['length_of_stay']:.1f} hari")
+
+with col3:
+    st.metric("Rata-rata Biaya", f"${stats['billing_amount']:,.0f}")
+
+with col4:
+    st.metric("Tingkat Pemulihan", f"{stats['is_normal'] * 100:.1f}%")
+
+# ============================================================
+# 1️⃣ TREN PENYAKIT
+# ============================================================
+if analysis_focus == "Tren Penyakit":
+    st.markdown('<div class="section-title">Analisis Tren Penyakit</div>', unsafe_allow_html=True)
+    
+    col1, col2 = st.columns([2, 1])
+    
+    with col1:
+        # Line Chart: Disease trends over time
+        st.subheader("Tren Penyakit Berdasarkan Waktu")
+        
+        trend_json = trend_figure_json(year_filter, condition_filter, age_range)
+
+        if trend_json is not None:
+            fig_trend = pio.from_json(trend_json)
+            st.plotly_chart(fig_trend, use_container_width=True, key='trend_line')
+    
+    with col2:
+        # Top conditions - simple version
+        st.subheader("Kondisi Medis Paling Umum")
+        top_conditions = agg['top_conditions']
+        
+        fig_top_conditions = go.Figure(go.Bar(
+            x=top_conditions.values,
+            y=top_conditions.index,
+            orientation='h',
+            marker=dict(color=top_conditions.values, colorscale='Blues', showscale=True)
+        ))
+
+        fig_top_conditions.update_layout(
+            title="Distribusi Kondisi Medis",
+            xaxis_title="Jumlah Pasien",
+            showlegend=False,
+            yaxis={'categoryorder': 'total ascending'},
+            margin=dict(l=20, r=20, t=50, b=20)
+        )
+        
+        st.plotly_chart(fig_top_conditions, use_container_width=True, key='top_conditions_bar')
+        
+        # Optional: Show summary statistics
+        st.caption(f"Total {len(filtered_df)} pasien • {top_conditions.index[0]} paling umum ({top_conditions.iloc[0]} pasien)")
+    
+    # Seasonal patterns
+    st.subheader("Pola Kunjungan Rumah Sakit Musiman")
+    monthly_visits_complete = agg['monthly_visits']
+
+    month_names = ['Jan', 'Feb', 'Mar', 'Apr', 'Mei', 'Jun', 
+                   'Jul', 'Agu', 'Sep', 'Okt', 'Nov', 'Des']
+    
+    fig_seasonal = go.Figure(go.Bar(
+        x=month_names,
+        y=monthly_visits_complete,
+        marker=dict(color=monthly_visits_complete, colorscale='Blues', showscale=True)
+    ))
+    fig_seasonal.update_layout(
+        title="Kunjungan Rumah Sakit per Bulan",
+        xaxis_title="Bulan",
+        yaxis_title="Jumlah Pasien"
+    )
+    st.plotly_chart(fig_seasonal, use_container_width=True, key='seasonal_bar')
+    
+    # Admission types by condition
+    st.subheader("Tipe Penerimaan per Kondisi Medis")
+    admission_condition = agg['admission_condition']
+
+    admission_colors = {
+        'Emergency': '#DC2626',
+        'Urgent': '#EA580C',
+        'Elective': '#16A34A'
+    }
+    fig_admission = go.Figure()
+    for adm_type in admission_condition.columns:
+        fig_admission.add_trace(go.Bar(
+            x=admission_condition.index,
+            y=admission_condition[adm_type],
+            name=str(adm_type),
+            marker_color=admission_colors.get(adm_type)
+        ))
+    fig_admission.update_layout(
+        title="Distribusi Tipe Penerimaan per Kondisi Medis",
+        barmode='group',
+        xaxis_title="Kondisi Medis",
+        yaxis_title="Jumlah Pasien"
+    )
+    st.plotly_chart(fig_admission, use_container_width=True, key='admission_bar')
+
+# ============================================================
+# 2️⃣ BIAYA PENGOBATAN
+# ============================================================
+elif analysis_focus == "Biaya Pengobatan":
+    st.markdown('<div class="section-title">Analisis Biaya Pengobatan</div>', unsafe_allow_html=True)
+    
+    # Average cost by hospital
+    st.subheader("Rata-rata Biaya per Rumah Sakit")
+    hospital_costs = agg['hospital_costs']
+    
+    fig_hospital_cost = go.Figure(go.Bar(
+        x=hospital_costs.values,
+        y=hospital_costs.index,
+        orientation='h',
+        marker=dict(color=hospital_costs.values, colorscale='Reds', showscale=True)
+    ))
+
+    fig_hospital_cost.update_layout(
+        title="10 Rumah Sakit dengan Biaya Tertinggi",
+        xaxis_title="Rata-rata Biaya ($)",
+        yaxis_title="Rumah Sakit",
+        autosize=True,
+        margin=dict(l=20, r=20, t=50, b=20),
+    )
+    fig_hospital_cost.update_yaxes(autorange="reversed")
+    
+    st.plotly_chart(fig_hospital_cost, use_container_width=True, key='hospital_cost_bar')
+    
+    # Insurance and costs: distribution pie and cost bar share one figure,
+    # so the pair ships a single layout and one Plotly.js init per rerun
+    st.subheader("Analisis Biaya Berdasarkan Asuransi")
+    insurance_counts = agg['insurance_counts']
+    insurance_costs = agg['insurance_costs']
+    insurance_colors = {
+        'Cigna': "#75B0EB",
+        'Medicare': "#2F5FE3",
+        'UnitedHealthCare': "#EDC0D0",
+        'Blue Cross': "#E20B0B",
+        'Aetna': "#7BD894",
+    }
+
+    fig_insurance = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'domain'}, {'type': 'xy'}]],
+        subplot_titles=("Distribusi Provider Asuransi", "Rata-rata Biaya per Provider Asuransi")
+    )
+    fig_insurance.add_trace(go.Pie(
+        values=insurance_counts.values,
+        labels=insurance_counts.index
+    ), row=1, col=1)
+    fig_insurance.add_trace(go.Bar(
+        x=insurance_costs.index,
+        y=insurance_costs.values,
+        marker_color=[insurance_colors.get(p, '#636EFA') for p in insurance_costs.index],
+        showlegend=False  # Hide legend since colors are self-explanatory
+    ), row=1, col=2)
+    fig_insurance.update_xaxes(title_text="Provider Asuransi", row=1, col=2)
+    fig_insurance.update_yaxes(title_text="Rata-rata Biaya ($)", row=1, col=2)
+    st.plotly_chart(fig_insurance, use_container_width=True, key='insurance_overview')
+    
+    # Cost vs Recovery analysis
+    st.subheader("Analisis Hubungan Biaya dengan Tingkat Pemulihan")
+    condition_analysis = agg['condition_analysis']
+    
+    fig_cost_recovery = px.scatter(
+        condition_analysis,
+        x='Biaya_Rata',
+        y='Tingkat_Pemulihan',
+        size='Masa_Rawat_Rata',
+        color='Kondisi_Medis',
+        title="Hubungan Biaya Pengobatan dengan Tingkat Pemulihan",
+        labels={
+            'Biaya_Rata': 'Rata-rata Biaya ($)',
+            'Tingkat_Pemulihan': 'Tingkat Pemulihan (%)',
+            'Masa_Rawat_Rata': 'Rata-rata Masa Rawat (hari)'
+        },
+        hover_data=['Kondisi_Medis', 'Biaya_Rata', 'Tingkat_Pemulihan', 'Masa_Rawat_Rata'],
+        render_mode='webgl'
+    )
+    st.plotly_chart(fig_cost_recovery, use_container_width=True, key='cost_recovery_scatter')
+
+# ============================================================
+# 3️⃣ DEMOGRAFI PASIEN
+# ============================================================
+elif analysis_focus == "Demografi Pasien":
+    st.markdown('<div class="section-title">Analisis Demografi Pasien</div>', unsafe_allow_html=True)
+    
+    # Age and gender distributions as one two-panel figure: single layout
+    # and a single Plotly.js init instead of two side-by-side charts
+    st.subheader("Distribusi Usia dan Jenis Kelamin")
+    age_counts = agg['age_counts']
+    gender_counts = agg['gender_counts']
+
+    age_colors = ['#3498DB', '#9B59B6', '#2ECC71', '#F39C12', '#E74C3C']
+    fig_age_gender = make_subplots(
+        rows=1, cols=2,
+        specs=[[{'type': 'xy'}, {'type': 'domain'}]],
+        subplot_titles=("Distribusi Pasien berdasarkan Kelompok Usia", "Proporsi Jenis Kelamin Pasien")
+    )
+    fig_age_gender.add_trace(go.Bar(
+        x=age_counts.index,
+        y=age_counts.values,
+        marker_color=age_colors[:len(age_counts)],
+        showlegend=False
+    ), row=1, col=1)
+    fig_age_gender.add_trace(go.Pie(
+        values=gender_counts.values,
+        labels=gender_counts.index,
+        marker_colors=['#4A90E2', '#FF6B9D'],
+        textinfo='percent+label'
+    ), row=1, col=2)
+    fig_age_gender.update_xaxes(title_text="Kelompok Usia", row=1, col=1)
+    fig_age_gender.update_yaxes(title_text="Jumlah Pasien", row=1, col=1)
+    st.plotly_chart(fig_age_gender, use_container_width=True, key='age_gender_overview')
+    
+    # Gender by condition
+    st.subheader("Kondisi Medis berdasarkan Jenis Kelamin")
+    gender_condition_top = agg['gender_condition_top']
+    
+    gender_colors = ['#FF6B9D', '#4A90E2']
+    fig_gender_condition = go.Figure()
+    for color, gender in zip(gender_colors, gender_condition_top.columns):
+        fig_gender_condition.add_trace(go.Bar(
+            x=gender_condition_top.index,
+            y=gender_condition_top[gender],
+            name=str(gender),
+            marker_color=color
+        ))
+    fig_gender_condition.update_layout(
+        title="6 Kondisi Medis Terbanyak berdasarkan Jenis Kelamin",
+        barmode='group',
+        xaxis_title="Kondisi Medis",
+        yaxis_title="Jumlah Pasien"
+    )
+    st.plotly_chart(fig_gender_condition, use_container_width=True, key='gender_condition_bar')
+    
+    # Blood type distribution
+    st.subheader("Distribusi Golongan Darah")
+    blood_counts = agg['blood_counts']
+    
+    fig_blood = go.Figure(go.Bar(
+        x=blood_counts.index,
+        y=blood_counts.values,
+        marker_color=px.colors.qualitative.Bold[:len(blood_counts)]
+    ))
+    fig_blood.update_layout(
+        title="Distribusi Golongan Darah Pasien",
+        xaxis_title="Golongan Darah",
+        yaxis_title="Jumlah Pasien",
+        showlegend=False
+    )
+    st.plotly_chart(fig_blood, use_container_width=True, key='blood_bar')
+    
+    # Hospital demographics
+    st.subheader("Distribusi Pasien per Rumah Sakit")
+    
+    total_hospitals = filtered_df['hospital'].nunique()
+    total_patients = len(filtered_df)
+    
+    hospital_demo_top = agg['hospital_demo_top']
+    
+    top_hospitals_total_patients = hospital_demo_top.values.sum()
+    percentage_of_total = (top_hospitals_total_patients / total_patients) * 100
+    
+    fig_hospital_demo = go.Figure()
+    for color, gender in zip(['#FF6B9D', '#4A90E2'], hospital_demo_top.columns):
+        fig_hospital_demo.add_trace(go.Bar(
+            x=hospital_demo_top.index,
+            y=hospital_demo_top[gender],
+            name=str(gender),
+            marker_color=color
+        ))
+    fig_hospital_demo.update_layout(
+        title=f"8 Rumah Sakit dengan Volume Pasien Tertinggi ({percentage_of_total:.1f}% dari {total_patients:,} total pasien)",
+        barmode='group',
+        xaxis_title="Rumah Sakit",
+        yaxis_title="Jumlah Pasien"
+    )
+    
+    # Add subtitle with context
+    st.caption(f"Menampilkan 8 rumah sakit teratas dari total {total_hospitals} rumah sakit")
+    st.plotly_chart(fig_hospital_demo, use_container_width=True, key='hospital_demo_bar')
+
+# Footer
+st.markdown("---")
+st.markdown(FOOTER_HTML, unsafe_allow_html=True)
+
+st.sidebar.markdown("---")
+st.sidebar.markdown(SIDEBAR_GUIDE)